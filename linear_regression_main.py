@@ -16,10 +16,183 @@ from typing import Tuple, Dict, Any
 import json
 import logging
 
+try:
+    import numba as nb
+except ImportError:  # numba is optional; the NumPy reductions are used instead
+    nb = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Sample size above which the numba kernel parallelizes its reductions
+_PARALLEL_THRESHOLD = 1_000_000
+
+# Number of chunks the parallel kernel splits the data into before merging
+_PARALLEL_CHUNKS = 64
+
+# Points per cache-resident block; each block is centred on its own mean
+_BLOCK_SIZE = 4096
+
+# Points per block the NumPy fallback centres in float64 scratch buffers
+_FALLBACK_BLOCK_SIZE = 65536
+
+# Elements per row block when batch_analyze() builds its y matrix
+_BATCH_BLOCK_SIZE = 1_000_000
+
+
+if nb is not None:
+    @nb.njit(fastmath={'reassoc', 'contract'}, cache=True)
+    def _block_moments(x, y, start, stop):
+        """Two-pass means and centred co-moments over a cache-resident block."""
+        count = stop - start
+        sum_x = 0.0
+        sum_y = 0.0
+        for i in range(start, stop):
+            sum_x += np.float64(x[i])
+            sum_y += np.float64(y[i])
+        mean_x = sum_x / count
+        mean_y = sum_y / count
+        m_xx = 0.0
+        m_xy = 0.0
+        m_yy = 0.0
+        for i in range(start, stop):
+            dx = np.float64(x[i]) - mean_x
+            dy = np.float64(y[i]) - mean_y
+            m_xx += dx * dx
+            m_xy += dx * dy
+            m_yy += dy * dy
+        return count, mean_x, mean_y, m_xx, m_xy, m_yy
+
+    @nb.njit(cache=True)
+    def _merge_moments(count_a, mean_x_a, mean_y_a, m_xx_a, m_xy_a, m_yy_a,
+                       count_b, mean_x_b, mean_y_b, m_xx_b, m_xy_b, m_yy_b):
+        """Combine two sets of moments with Chan's pairwise formula."""
+        if count_a == 0:
+            return count_b, mean_x_b, mean_y_b, m_xx_b, m_xy_b, m_yy_b
+        if count_b == 0:
+            return count_a, mean_x_a, mean_y_a, m_xx_a, m_xy_a, m_yy_a
+        total = count_a + count_b
+        dx = mean_x_b - mean_x_a
+        dy = mean_y_b - mean_y_a
+        weight = count_a * count_b / total
+        return (total,
+                mean_x_a + dx * count_b / total,
+                mean_y_a + dy * count_b / total,
+                m_xx_a + m_xx_b + dx * dx * weight,
+                m_xy_a + m_xy_b + dx * dy * weight,
+                m_yy_a + m_yy_b + dy * dy * weight)
+
+    @nb.njit(cache=True)
+    def _range_moments(x, y, start, stop):
+        """Moments over x[start:stop], block by block, merged with Chan's formula."""
+        count, mean_x, mean_y, m_xx, m_xy, m_yy = 0, 0.0, 0.0, 0.0, 0.0, 0.0
+        for block_start in range(start, stop, _BLOCK_SIZE):
+            block_stop = min(block_start + _BLOCK_SIZE, stop)
+            count, mean_x, mean_y, m_xx, m_xy, m_yy = _merge_moments(
+                count, mean_x, mean_y, m_xx, m_xy, m_yy,
+                *_block_moments(x, y, block_start, block_stop))
+        return count, mean_x, mean_y, m_xx, m_xy, m_yy
+
+    def _regress_moments(x, y):
+        """Means and centred sums of squares Mxx, Mxy, Myy in one sweep over memory."""
+        _, mean_x, mean_y, m_xx, m_xy, m_yy = _range_moments(x, y, 0, x.shape[0])
+        return mean_x, mean_y, m_xx, m_xy, m_yy
+
+    def _regress_moments_chunked(x, y):
+        """Blocked moments over independent chunks in parallel, then merged."""
+        n = x.shape[0]
+        chunk = (n + _PARALLEL_CHUNKS - 1) // _PARALLEL_CHUNKS
+        partial = np.zeros((_PARALLEL_CHUNKS, 6))
+        for c in nb.prange(_PARALLEL_CHUNKS):
+            start = min(c * chunk, n)
+            stop = min(start + chunk, n)
+            count_c, mean_x, mean_y, m_xx, m_xy, m_yy = _range_moments(x, y, start, stop)
+            partial[c, 0] = count_c
+            partial[c, 1] = mean_x
+            partial[c, 2] = mean_y
+            partial[c, 3] = m_xx
+            partial[c, 4] = m_xy
+            partial[c, 5] = m_yy
+
+        count, mean_x, mean_y, m_xx, m_xy, m_yy = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+        for c in range(_PARALLEL_CHUNKS):
+            count, mean_x, mean_y, m_xx, m_xy, m_yy = _merge_moments(
+                count, mean_x, mean_y, m_xx, m_xy, m_yy,
+                partial[c, 0], partial[c, 1], partial[c, 2],
+                partial[c, 3], partial[c, 4], partial[c, 5])
+        return mean_x, mean_y, m_xx, m_xy, m_yy
+
+    _kernel_signature = nb.types.UniTuple(nb.float64, 5)(nb.float32[::1], nb.float32[::1])
+    _regress_kernel = nb.njit(_kernel_signature, cache=True)(_regress_moments)
+    # No signature: the parallel variant only runs above _PARALLEL_THRESHOLD,
+    # so it is compiled lazily on first use instead of at import time
+    _regress_kernel_parallel = nb.njit(cache=True, parallel=True)(_regress_moments_chunked)
+
+    @nb.njit(cache=True)
+    def _generate_y(x, u, slope, intercept, scale, shift, out):
+        """
+        Fill out with y = (x·slope + intercept) + (u·scale - shift).
+
+        The constants are passed as float32 and each operation rounds to
+        float32 in the same order as the NumPy in-place fallback in
+        _generate(), so a seed yields bit-identical data with or without numba.
+        """
+        for i in range(x.shape[0]):
+            noise = u[i] * scale - shift
+            out[i] = (x[i] * slope + intercept) + noise
+
+
+def _accumulate_moments(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    Compute the means and centred sums of squares SSxx, SSxy and SSyy.
+
+    Both backends centre each block of data on its own mean before summing
+    squares, which avoids the catastrophic cancellation of the raw-sum form
+    Sxx - Sx²/N on float32 data. With numba, a compiled kernel does this over
+    cache-resident blocks and merges them with Chan's formula, running faster
+    than the NumPy path. Without numba, the NumPy fallback centres
+    larger blocks into float64 scratch buffers and combines them as
+    within-block plus between-block sums.
+    """
+    if nb is not None and x.shape[0] > 0:
+        kernel = _regress_kernel_parallel if x.shape[0] > _PARALLEL_THRESHOLD else _regress_kernel
+        # NumPy scalars keep degenerate fits (e.g. constant x) at nan with a
+        # RuntimeWarning, exactly like the NumPy path, instead of raising
+        return tuple(np.float64(value) for value in kernel(x, y))
+    
+    n = x.shape[0]
+    block = max(1, min(n, _FALLBACK_BLOCK_SIZE))
+    dx = np.empty(block, dtype=np.float64)
+    dy = np.empty(block, dtype=np.float64)
+    counts, means_x, means_y, m_xx, m_xy, m_yy = [], [], [], [], [], []
+    for start in range(0, n, block):
+        x_block = x[start:start + block]
+        y_block = y[start:start + block]
+        count = x_block.shape[0]
+        mean_x = np.add.reduce(x_block, dtype=np.float64) / count
+        mean_y = np.add.reduce(y_block, dtype=np.float64) / count
+        np.subtract(x_block, mean_x, out=dx[:count])
+        np.subtract(y_block, mean_y, out=dy[:count])
+        counts.append(count)
+        means_x.append(mean_x)
+        means_y.append(mean_y)
+        m_xx.append(np.dot(dx[:count], dx[:count]))
+        m_xy.append(np.dot(dx[:count], dy[:count]))
+        m_yy.append(np.dot(dy[:count], dy[:count]))
+    
+    counts = np.array(counts, dtype=np.float64)
+    means_x = np.array(means_x, dtype=np.float64)
+    means_y = np.array(means_y, dtype=np.float64)
+    mean_x = np.dot(counts, means_x) / n
+    mean_y = np.dot(counts, means_y) / n
+    shift_x = means_x - mean_x
+    shift_y = means_y - mean_y
+    ss_xx = np.sum(m_xx, dtype=np.float64) + np.dot(counts, shift_x * shift_x)
+    ss_xy = np.sum(m_xy, dtype=np.float64) + np.dot(counts, shift_x * shift_y)
+    ss_yy = np.sum(m_yy, dtype=np.float64) + np.dot(counts, shift_y * shift_y)
+    return mean_x, mean_y, ss_xx, ss_xy, ss_yy
+
 
 class LinearRegressionAnalyzer:
     """
@@ -27,6 +200,10 @@ class LinearRegressionAnalyzer:
     vector-based calculations, and comprehensive visualization.
     """
     
+    __slots__ = ('sample_size', 'x', 'y', 'beta0', 'beta1', 'mean_x', 'mean_y',
+                 'r_squared', 'results', '_rng', '_noise', '_has_data',
+                 '_ss_xx', '_ss_xy', '_ss_yy')
+    
     def __init__(self, sample_size: int = 10000, random_seed: int = None):
         """
         Initialize the Linear Regression Analyzer.
@@ -36,17 +213,38 @@ class LinearRegressionAnalyzer:
             random_seed (int): Random seed for reproducibility
         """
         self.sample_size = sample_size
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        self._rng = np.random.default_rng(random_seed)
+        
+        # Data buffers are allocated once and refilled by every step1 call
+        self.x = np.empty(sample_size, dtype=np.float32)
+        self.y = np.empty(sample_size, dtype=np.float32)
+        self._noise = np.empty(sample_size, dtype=np.float32)
+        self._has_data = False
+        
+        # Centred sums of squares; with the means they are the primary statistics
+        self._ss_xx = self._ss_xy = self._ss_yy = None
         
-        self.points = None
         self.beta0 = None
         self.beta1 = None
+        self.mean_x = None
+        self.mean_y = None
         self.r_squared = None
         self.results = {}
         
         logger.info(f"LinearRegressionAnalyzer initialized with sample_size={sample_size}")
     
+    @property
+    def points(self) -> np.ndarray:
+        """
+        Data points as an (n, 2) array.
+        
+        Coordinates are stored as two contiguous 1-D arrays (self.x, self.y);
+        this view is materialized on demand, e.g. for plotting.
+        """
+        if not self._has_data:
+            return None
+        return np.column_stack((self.x, self.y))
+    
     def step1_generate_synthetic_data(self, true_slope: float = 0.6, true_intercept: float = 0.3, 
                                     noise_range: float = 0.3) -> np.ndarray:
         """
@@ -62,81 +260,166 @@ class LinearRegressionAnalyzer:
         Returns:
             np.ndarray: Array of generated points with shape (n, 2)
         """
-        logger.info("Step 1: Generating synthetic data...")
+        self._generate(true_slope, true_intercept, noise_range)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Generated {self.sample_size} synthetic data points")
+        return self.points
+    
+    def _generate(self, true_slope: float = 0.6, true_intercept: float = 0.3,
+                  noise_range: float = 0.3) -> None:
+        """
+        Refill the preallocated x and y buffers with a new synthetic dataset.
+        
+        Unlike step1_generate_synthetic_data(), this does not build the (n, 2)
+        points array, so repeated analyses allocate no N-sized arrays.
+        """
+        logger.debug("Step 1: Generating synthetic data...")
+        
+        # Coordinates are float32 arrays preallocated in __init__; the data
+        # spans roughly [-0.3, 1.3], so single precision loses nothing meaningful
         
         # Generate x-coordinates randomly between 0 and 1
-        x_coords = np.random.rand(self.sample_size)
+        self._rng.random(dtype=np.float32, out=self.x)
         
-        # Generate y-coordinates based on linear formula with noise
-        random_noise = -noise_range + (2 * noise_range) * np.random.rand(self.sample_size)
-        y_coords = true_slope * x_coords + true_intercept + random_noise
+        # Draw uniform noise samples, scaled to [-noise_range, noise_range) below
+        self._rng.random(dtype=np.float32, out=self._noise)
         
-        # Combine into points array
-        self.points = np.column_stack((x_coords, y_coords))
+        # Generate y-coordinates based on linear formula with noise, in place
+        if nb is not None:
+            _generate_y(self.x, self._noise, np.float32(true_slope), np.float32(true_intercept),
+                        np.float32(2 * noise_range), np.float32(noise_range), self.y)
+        else:
+            np.multiply(self._noise, 2 * noise_range, out=self._noise)
+            self._noise -= noise_range
+            np.multiply(self.x, true_slope, out=self.y)
+            self.y += true_intercept
+            self.y += self._noise
+        self._has_data = True
+        
+        # Invalidate statistics from any previous dataset
+        self._ss_xx = self._ss_xy = self._ss_yy = None
+        self.beta0 = self.beta1 = self.r_squared = None
+        self.mean_x = self.mean_y = None
+        self.results = {}
+    
+    def _compute_stats(self) -> None:
+        """
+        Compute all regression statistics in a single pass over the data.
+
+        Accumulates the means and centred sums of squares once and derives the
+        slope, intercept, SST, SSR and R-squared algebraically, so no deviation
+        or prediction arrays are ever materialized. The float32 data is read
+        as-is while every accumulator is widened to float64; see
+        _accumulate_moments() for the numba and NumPy backends.
+        """
+        if not self._has_data:
+            raise ValueError("Data not generated. Call step1_generate_synthetic_data() first.")
         
-        logger.info(f"Generated {self.sample_size} synthetic data points")
-        return self.points
+        (self.mean_x, self.mean_y,
+         self._ss_xx, self._ss_xy, self._ss_yy) = _accumulate_moments(self.x, self.y)
+        self._derive_fit()
+    
+    def _derive_fit(self) -> None:
+        """
+        Derive the slope, intercept, R-squared, SST and SSR from the cached
+        means and centred sums of squares, keeping self.results consistent.
+        """
+        self.beta1 = self._ss_xy / self._ss_xx
+        self.beta0 = self.mean_y - self.beta1 * self.mean_x
+        
+        # R² is the squared Pearson correlation: SSxy² / (SSxx·SSyy)
+        self.r_squared = self._ss_xy**2 / (self._ss_xx * self._ss_yy)
+        
+        # SST = Σ(y-ȳ)², SSR = SST·(1 - R²)
+        sst = self._ss_yy
+        ssr = sst * (1 - self.r_squared)
+        
+        self.results.update({
+            'mean_x': self.mean_x,
+            'mean_y': self.mean_y,
+            'beta1': self.beta1,
+            'beta0': self.beta0,
+            'sst': sst,
+            'ssr': ssr,
+            'r_squared': self.r_squared
+        })
     
     def step2_calculate_means(self) -> Tuple[float, float]:
         """
         Step 2: Calculate means of x and y coordinates.
         
+        Triggers the single-pass statistics computation; later steps read
+        their values from the cached results.
+        
         Returns:
             Tuple[float, float]: Mean of x-coordinates and mean of y-coordinates
         """
-        logger.info("Step 2: Calculating means...")
-        
-        if self.points is None:
-            raise ValueError("Data not generated. Call step1_generate_synthetic_data() first.")
-        
-        mean_x = np.mean(self.points[:, 0])
-        mean_y = np.mean(self.points[:, 1])
+        logger.debug("Step 2: Calculating means...")
         
-        self.results['mean_x'] = mean_x
-        self.results['mean_y'] = mean_y
+        if self.mean_x is None:
+            self._compute_stats()
         
-        logger.info(f"Mean X: {mean_x:.6f}, Mean Y: {mean_y:.6f}")
-        return mean_x, mean_y
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Mean X: {self.mean_x:.6f}, Mean Y: {self.mean_y:.6f}")
+        return self.mean_x, self.mean_y
     
     def step3_calculate_deviations(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Step 3: Calculate deviations from means for both coordinates.
         
+        Kept for the step-by-step workflow; the regression itself no longer
+        needs the deviation arrays.
+        
         Returns:
             Tuple[np.ndarray, np.ndarray]: X deviations and Y deviations
         """
-        logger.info("Step 3: Calculating deviations from means...")
+        logger.debug("Step 3: Calculating deviations from means...")
         
-        mean_x, mean_y = self.results['mean_x'], self.results['mean_y']
+        mean_x, mean_y = self.step2_calculate_means()
         
-        x_deviations = self.points[:, 0] - mean_x
-        y_deviations = self.points[:, 1] - mean_y
+        # Deviations are widened to float64 so later dot products accumulate in double
+        x_deviations = np.subtract(self.x, mean_x, dtype=np.float64)
+        y_deviations = np.subtract(self.y, mean_y, dtype=np.float64)
         
-        logger.info("Deviations calculated successfully")
+        logger.debug("Deviations calculated successfully")
         return x_deviations, y_deviations
     
-    def step4_calculate_slope(self, x_deviations: np.ndarray, y_deviations: np.ndarray) -> float:
+    def step4_calculate_slope(self, x_deviations: np.ndarray = None,
+                              y_deviations: np.ndarray = None) -> float:
         """
         Step 4: Calculate slope using vector operations.
         
-        Formula: beta1 = dot(x_deviations, y_deviations) / dot(x_deviations, x_deviations)
+        Formula: beta1 = (N·Sxy - Sx·Sy) / (N·Sxx - Sx²)
+        
+        When deviations are passed in, the equivalent dot-product form
+        beta1 = dot(x_deviations, y_deviations) / dot(x_deviations, x_deviations)
+        is used instead, and the intercept, R-squared, SST and SSR are
+        refreshed from the same deviations.
         
         Args:
-            x_deviations (np.ndarray): Deviations of x from mean
-            y_deviations (np.ndarray): Deviations of y from mean
+            x_deviations (np.ndarray): Deviations of x from mean (optional)
+            y_deviations (np.ndarray): Deviations of y from mean (optional)
         
         Returns:
             float: Calculated slope (beta1)
         """
-        logger.info("Step 4: Calculating slope using vector operations...")
-        
-        numerator = np.dot(x_deviations, y_deviations)
-        denominator = np.dot(x_deviations, x_deviations)
-        
-        self.beta1 = numerator / denominator
-        self.results['beta1'] = self.beta1
-        
-        logger.info(f"Calculated slope (beta1): {self.beta1:.6f}")
+        logger.debug("Step 4: Calculating slope using vector operations...")
+        
+        if x_deviations is not None and y_deviations is not None:
+            if self.mean_x is None:
+                self._compute_stats()
+            
+            # Refit from the given deviations so every slope-dependent value agrees
+            self._ss_xy = np.einsum('i,i->', x_deviations, y_deviations, dtype=np.float64)
+            self._ss_xx = np.einsum('i,i->', x_deviations, x_deviations, dtype=np.float64)
+            self._ss_yy = np.einsum('i,i->', y_deviations, y_deviations, dtype=np.float64)
+            self._derive_fit()
+        elif self.beta1 is None:
+            self._compute_stats()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Calculated slope (beta1): {self.beta1:.6f}")
         return self.beta1
     
     def step5_calculate_intercept(self) -> float:
@@ -145,52 +428,42 @@ class LinearRegressionAnalyzer:
         
         Formula: beta0 = mean_y - beta1 * mean_x
         
+        The intercept is derived together with the slope by _compute_stats(),
+        so this step only reads the cached value.
+        
         Returns:
             float: Calculated intercept (beta0)
         """
-        logger.info("Step 5: Calculating intercept...")
+        logger.debug("Step 5: Calculating intercept...")
         
-        mean_x, mean_y = self.results['mean_x'], self.results['mean_y']
+        if self.beta1 is None:
+            self._compute_stats()
         
-        self.beta0 = mean_y - self.beta1 * mean_x
-        self.results['beta0'] = self.beta0
-        
-        logger.info(f"Calculated intercept (beta0): {self.beta0:.6f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Calculated intercept (beta0): {self.beta0:.6f}")
         return self.beta0
     
     def step6_calculate_r_squared(self) -> float:
         """
         Step 6: Calculate R-squared value to measure model performance.
         
-        Formula: R² = 1 - (SSR / SST)
+        Formula: R² = 1 - (SSR / SST) = SSxy² / (SSxx · SSyy)
         where SSR = sum of squared residuals, SST = total sum of squares
         
+        For simple linear regression this equals the squared Pearson
+        correlation, which _compute_stats() derives from the centred sums
+        already used for the slope, so this step only reads the cached value.
+        
         Returns:
             float: R-squared value
         """
-        logger.info("Step 6: Calculating R-squared value...")
-        
-        # Calculate predicted y-values
-        y_predicted = self.beta1 * self.points[:, 0] + self.beta0
-        
-        # Calculate total sum of squares (SST)
-        mean_y = self.results['mean_y']
-        sst = np.sum((self.points[:, 1] - mean_y)**2)
-        
-        # Calculate residual sum of squares (SSR)
-        ssr = np.sum((self.points[:, 1] - y_predicted)**2)
+        logger.debug("Step 6: Calculating R-squared value...")
         
-        # Calculate R-squared
-        self.r_squared = 1 - (ssr / sst)
+        if self.r_squared is None:
+            self._compute_stats()
         
-        self.results.update({
-            'y_predicted': y_predicted,
-            'sst': sst,
-            'ssr': ssr,
-            'r_squared': self.r_squared
-        })
-        
-        logger.info(f"R-squared value: {self.r_squared:.6f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"R-squared value: {self.r_squared:.6f}")
         return self.r_squared
     
     def step7_visualize_results(self, figsize: Tuple[int, int] = (12, 5)) -> None:
@@ -200,22 +473,23 @@ class LinearRegressionAnalyzer:
         Args:
             figsize (Tuple[int, int]): Figure size for the plots
         """
-        logger.info("Step 7: Creating visualizations...")
+        logger.debug("Step 7: Creating visualizations...")
+        
+        x, y = self.x, self.y
         
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
         
-        # Plot 1: Original data points
-        ax1.scatter(self.points[:, 0], self.points[:, 1], s=5, alpha=0.6)
-        ax1.set_title(f'Original Data Points\n({self.sample_size} Random Points)')
+        # Plot 1: Density of the original data points, drawn as a single mesh
+        ax1.hist2d(x, y, bins=50, range=((0, 1), (0, 1)), cmap='Blues')
+        ax1.set_title(f'Original Data Density\n({self.sample_size} Random Points)')
         ax1.set_xlabel('X-coordinate')
         ax1.set_ylabel('Y-coordinate')
         ax1.set_xlim(0, 1)
         ax1.set_ylim(0, 1)
         ax1.grid(True, alpha=0.3)
         
-        # Plot 2: Data points with regression line
-        ax2.scatter(self.points[:, 0], self.points[:, 1], s=5, alpha=0.6, 
-                   label='Data Points', color='blue')
+        # Plot 2: Data points (pixel markers) with regression line
+        ax2.plot(x, y, ',', alpha=0.4, label='Data Points', color='blue')
         
         # Generate regression line
         x_line = np.array([0, 1])
@@ -234,7 +508,7 @@ class LinearRegressionAnalyzer:
         plt.tight_layout()
         plt.show()
         
-        logger.info("Visualizations created successfully")
+        logger.debug("Visualizations created successfully")
     
     def step8_generate_report(self) -> Dict[str, Any]:
         """
@@ -243,7 +517,7 @@ class LinearRegressionAnalyzer:
         Returns:
             Dict[str, Any]: Complete analysis results and interpretation
         """
-        logger.info("Step 8: Generating analysis report...")
+        logger.debug("Step 8: Generating analysis report...")
         
         # Interpret R-squared value
         r2_interpretation = self._interpret_r_squared(self.r_squared)
@@ -269,7 +543,7 @@ class LinearRegressionAnalyzer:
             'analysis_insights': self._generate_insights()
         }
         
-        logger.info("Analysis report generated successfully")
+        logger.debug("Analysis report generated successfully")
         return report
     
     def _interpret_r_squared(self, r_squared: float) -> str:
@@ -301,23 +575,143 @@ class LinearRegressionAnalyzer:
         
         return insights
     
-    def run_complete_analysis(self) -> Dict[str, Any]:
+    def fast_fit(self) -> Dict[str, float]:
+        """
+        Fit the regression with NumPy's LAPACK-backed routines.
+        
+        np.polyfit solves the least-squares problem via LAPACK gelsd and
+        R-squared is the squared Pearson correlation from np.corrcoef. Useful as
+        a quick production path and as a cross-check for the step-by-step
+        results; the analyzer's own fitted state is left untouched.
+        
+        Returns:
+            Dict[str, float]: 'beta0', 'beta1' and 'r_squared'
+        """
+        if not self._has_data:
+            raise ValueError("Data not generated. Call step1_generate_synthetic_data() first.")
+        
+        beta1, beta0 = np.polyfit(self.x, self.y, 1)
+        corr = np.corrcoef(self.x, self.y)[0, 1]
+        
+        return {
+            'beta0': float(beta0),
+            'beta1': float(beta1),
+            'r_squared': float(corr * corr)
+        }
+    
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        """
+        Predict y-values from the fitted regression line.
+        
+        Predictions are computed on demand rather than stored with the results.
+        
+        Args:
+            x (np.ndarray): X-coordinates to predict for
+        
+        Returns:
+            np.ndarray: Predicted y-values
+        """
+        if self.beta1 is None or self.beta0 is None:
+            raise ValueError("Model not fitted. Run the analysis steps first.")
+        
+        return self.beta1 * x + self.beta0
+    
+    @classmethod
+    def batch_analyze(cls, n_trials: int, sample_size: int = 10000, random_seed: int = None,
+                      true_slope: float = 0.6, true_intercept: float = 0.3,
+                      noise_range: float = 0.3) -> Dict[str, np.ndarray]:
+        """
+        Run many independent regressions at once on a (n_trials, sample_size) dataset.
+        
+        Each row is generated like step1_generate_synthetic_data() and all rows
+        are reduced together, so the cost of a Monte-Carlo study is a handful of
+        NumPy calls rather than one Python workflow per trial.
+        
+        Args:
+            n_trials (int): Number of independent datasets to analyze
+            sample_size (int): Number of data points per dataset
+            random_seed (int): Random seed for reproducibility
+            true_slope (float): True slope of the underlying relationship
+            true_intercept (float): True intercept of the underlying relationship
+            noise_range (float): Range of random noise to add (±noise_range)
+        
+        Returns:
+            Dict[str, np.ndarray]: Per-trial 'beta0', 'beta1', 'r_squared', 'sst'
+            and 'ssr' arrays
+        """
+        rng = np.random.default_rng(random_seed)
+        n = sample_size
+        
+        x = rng.random((n_trials, n), dtype=np.float32)
+        
+        # y = true_slope * x + true_intercept + noise, filled in row blocks of
+        # about _BATCH_BLOCK_SIZE elements so only one block-sized scratch
+        # buffer is needed and the loop runs ~n_trials·n/_BATCH_BLOCK_SIZE times
+        y = np.empty((n_trials, n), dtype=np.float32)
+        rows = max(1, _BATCH_BLOCK_SIZE // max(n, 1))
+        line = np.empty((min(rows, n_trials), n), dtype=np.float32)
+        for start in range(0, n_trials, rows):
+            stop = min(start + rows, n_trials)
+            y_block = y[start:stop]
+            line_block = line[:stop - start]
+            rng.random(dtype=np.float32, out=y_block)
+            y_block *= 2 * noise_range
+            y_block -= noise_range
+            np.multiply(x[start:stop], true_slope, out=line_block)
+            line_block += true_intercept
+            y_block += line_block
+        
+        # Per-row sums, accumulated in float64
+        sx = np.add.reduce(x, axis=1, dtype=np.float64)
+        sy = np.add.reduce(y, axis=1, dtype=np.float64)
+        sxx = np.einsum('ij,ij->i', x, x, dtype=np.float64)
+        sxy = np.einsum('ij,ij->i', x, y, dtype=np.float64)
+        syy = np.einsum('ij,ij->i', y, y, dtype=np.float64)
+        
+        numerator = n * sxy - sx * sy
+        denominator_x = n * sxx - sx**2
+        denominator_y = n * syy - sy**2
+        
+        beta1 = numerator / denominator_x
+        beta0 = (sy - beta1 * sx) / n
+        r_squared = numerator**2 / (denominator_x * denominator_y)
+        
+        # SST = Σ(y-ȳ)² and SSR = SST·(1 - R²) per trial, without residual arrays
+        sst = denominator_y / n
+        ssr = sst * (1 - r_squared)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Batch analysis finished for {n_trials} trials of {n} points")
+        
+        return {
+            'beta0': beta0,
+            'beta1': beta1,
+            'r_squared': r_squared,
+            'sst': sst,
+            'ssr': ssr
+        }
+    
+    def run_complete_analysis(self, visualize: bool = False) -> Dict[str, Any]:
         """
         Execute the complete linear regression analysis workflow.
         
+        Args:
+            visualize (bool): Whether to create the plots in step 7
+        
         Returns:
             Dict[str, Any]: Complete analysis results
         """
         logger.info("Starting complete linear regression analysis...")
         
-        # Execute all steps
-        self.step1_generate_synthetic_data()
+        # Execute all steps; data is generated directly into the preallocated
+        # buffers, skipping the (n, 2) array that step1 returns
+        self._generate()
         self.step2_calculate_means()
-        x_dev, y_dev = self.step3_calculate_deviations()
-        self.step4_calculate_slope(x_dev, y_dev)
+        self.step4_calculate_slope()
         self.step5_calculate_intercept()
         self.step6_calculate_r_squared()
-        self.step7_visualize_results()
+        if visualize:
+            self.step7_visualize_results()
         report = self.step8_generate_report()
         
         logger.info("Complete linear regression analysis finished")
@@ -333,7 +727,7 @@ def main():
     analyzer = LinearRegressionAnalyzer(sample_size=10000, random_seed=42)
     
     # Run complete analysis
-    report = analyzer.run_complete_analysis()
+    report = analyzer.run_complete_analysis(visualize=True)
     
     # Display results
     print("\n" + "="*50)